@@ -2,7 +2,7 @@ import numpy as np
 import xarray as xr
 import warnings
 import scipy.signal as ss
-from scipy.integrate import cumtrapz
+from scipy.integrate import cumulative_trapezoid
 
 from ..rotate import vector as rot
 from ..rotate.api import _make_model, rotate2
@@ -73,6 +73,9 @@ class CalcMotion():
     def _set_accel(self, ):
         ds = self.ds
         if ds.coord_sys == 'inst':
+            # orientmat is (3, 3, n_time) with time as the contiguous
+            # axis, so einsum is faster here than a batched np.matmul
+            # over an (n_time, 3, 3) view.
             self.accel = np.einsum('ij...,i...->j...',
                                    ds['orientmat'].values,
                                    ds['accel'].values)
@@ -127,9 +130,9 @@ class CalcMotion():
         if self.accel_filtfreq == 0:
             acc[:] = acc.mean(-1)[..., None]
         else:
-            flt = ss.butter(1, self.accel_filtfreq / (self.ds.fs / 2))
-            for idx in range(3):
-                acc[idx] = ss.filtfilt(flt[0], flt[1], acc[idx], axis=-1)
+            sos = ss.butter(1, self.accel_filtfreq / (self.ds.fs / 2),
+                            output='sos')
+            acc[:] = ss.sosfiltfilt(sos, acc, axis=-1)
 
             # Fill nan with zeros - happens for some filter frequencies
             if np.isnan(acc).any():
@@ -158,17 +161,15 @@ class CalcMotion():
         hp = self.accel - self.acclow
 
         # Integrate in time to get velocities
-        dat = np.concatenate((np.zeros(list(hp.shape[:-1]) + [1]),
-                              cumtrapz(hp, dx=1 / samp_freq, axis=-1)), axis=-1)
+        dat = cumulative_trapezoid(hp, dx=1 / samp_freq, axis=-1, initial=0)
 
         if self.accelvel_filtfreq > 0:
             filt_freq = self.accelvel_filtfreq
             # 2nd order Butterworth filter
-            # Applied twice by 'filtfilt' = 4th order butterworth
-            filt = ss.butter(2, float(filt_freq) / (samp_freq / 2))
-            for idx in range(hp.shape[0]):
-                dat[idx] = dat[idx] - \
-                    ss.filtfilt(filt[0], filt[1], dat[idx], axis=-1)
+            # Applied twice by 'sosfiltfilt' = 4th order butterworth
+            sos = ss.butter(2, float(filt_freq) / (samp_freq / 2),
+                            output='sos')
+            dat -= ss.sosfiltfilt(sos, dat, axis=-1)
 
             # Fill nan with zeros - happens for some filter frequencies
             if np.isnan(dat).any():
@@ -232,13 +233,10 @@ class CalcMotion():
         # cross-product of omega (rotation vector) and the vector.
         #   u=dz*omegaY-dy*omegaZ,v=dx*omegaZ-dz*omegaX,w=dy*omegaX-dx*omegaY
         # where vec=[dx,dy,dz], and angrt=[omegaX,omegaY,omegaZ]
-        velrot = np.array([(vec[2][:, None] * self.angrt[1] -
-                            vec[1][:, None] * self.angrt[2]),
-                           (vec[0][:, None] * self.angrt[2] -
-                            vec[2][:, None] * self.angrt[0]),
-                           (vec[1][:, None] * self.angrt[0] -
-                            vec[0][:, None] * self.angrt[1]),
-                           ])
+        # Broadcasting (3, 1, n_time) against (3, M, 1) computes this
+        # for every vector in a single pass, returning (3, M, n_time).
+        velrot = np.cross(self.angrt[:, None, :], vec[:, :, None],
+                          axisa=0, axisb=0, axisc=0)
 
         if to_earth:
             velrot = np.einsum('ji...,j...->i...',
@@ -398,11 +396,11 @@ def correct_motion(ds,
     if ds['angrt'].isnull().sum():
         raise Exception("There should be no missing data in `angrt` variable")
 
-    if hasattr(ds, 'velrot') or ds.attrs.get('motion corrected', False):
+    if 'velrot' in ds or ds.attrs.get('motion corrected', False):
         raise Exception('The data appears to already have been '
                         'motion corrected.')
 
-    if not hasattr(ds, 'has_imu') or ('accel' not in ds):
+    if 'has_imu' not in ds.attrs or ('accel' not in ds):
         raise Exception('The instrument does not appear to have an IMU.')
 
     if ds.coord_sys != 'inst':
@@ -439,22 +437,21 @@ def correct_motion(ds,
     velrot = calcobj.calc_velrot(pos, to_earth=False)
     if separate_probes:
         # The head->beam transformation matrix
-        transMat = ds.get('beam2inst_orientmat', None)
+        transMat = ds['beam2inst_orientmat'].values
         # The inst->head transformation matrix
-        rmat = ds['inst2head_rotmat']
-
-        # 1) Rotate body-coordinate velocities to head-coord.
-        velrot = np.dot(rmat, velrot)
-        # 2) Rotate body-coord to beam-coord (einsum),
-        # 3) Take along beam-component (diagonal),
-        # 4) Rotate back to head-coord (einsum),
-        velrot = np.einsum('ij,kj->ik',
-                           transMat,
-                           np.diagonal(np.einsum('ij,j...->i...',
-                                                 np.linalg.inv(transMat),
-                                                 velrot)))
+        rmat = ds['inst2head_rotmat'].values
+
+        # 1) Rotate body-coordinate velocities to head-coord,
+        # 2) Rotate body-coord to beam-coord, keeping only the
+        # 3) along-beam component of each probe (einsum),
+        # 4) Rotate back to head-coord,
         # 5) Rotate back to body-coord.
-        velrot = np.dot(rmat.T, velrot)
+        # The 3x3 matrices of steps 1-2 and 4-5 are combined first, so
+        # that the data is only passed over twice.
+        velrot = np.matmul(np.matmul(rmat.T, transMat),
+                           np.einsum('ij,ijn->in',
+                                     np.matmul(np.linalg.inv(transMat), rmat),
+                                     velrot))
     ds['velrot'] = xr.DataArray(velrot,
                                 dims=['dirIMU', 'time'],
                                 attrs={'units': 'm s-1',
@@ -1289,8 +1289,7 @@ def _recatenate(obj):
             continue
         val0 = obj[0][ky]
         if isinstance(val0, np.ndarray) and val0.size > 1:
-            out[ky] = np.concatenate([val[ky][..., None] for val in obj],
-                                     axis=-1)
+            out[ky] = np.stack([val[ky] for val in obj], axis=-1)
         else:
             out[ky] = np.array([val[ky] for val in obj])
     return out
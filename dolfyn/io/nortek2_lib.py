@@ -1,9 +1,9 @@
 import struct
+import mmap
 import os.path as path
 import numpy as np
 from logging import getLogger
 import warnings
-from .. import time
 from .base import _abspath
 
 
@@ -26,9 +26,12 @@ def _reduce_by_average_angle(data, ky0, ky1, degrees=True):
         rad_fact = 1
     if ky1 in data:
         if ky0 in data:
-            data[ky0] = np.angle(
-                np.exp(1j * data.pop(ky0) * rad_fact) +
-                np.exp(1j * data.pop(ky1) * rad_fact)) / rad_fact
+            # Sum the unit vectors directly, rather than as complex
+            # exponentials, to avoid allocating complex arrays.
+            a = data.pop(ky0) * rad_fact
+            b = data.pop(ky1) * rad_fact
+            data[ky0] = np.arctan2(np.sin(a) + np.sin(b),
+                                   np.cos(a) + np.cos(b)) / rad_fact
         else:
             data[ky0] = data.pop(ky1)
 
@@ -37,6 +40,11 @@ def _reduce_by_average_angle(data, ky0, ky1, degrees=True):
 # This must match what is written-out by the create_index function.
 _index_version = 1
 _hdr = struct.Struct('<BBBBhhh')
+# Record fields read by _create_index, at fixed offsets from the start
+# of the record header: version, offset, config, (4 skipped), date/time
+_rec_cfg_time = struct.Struct('<BBH4x6BH')
+_rec_beams_cy = struct.Struct('<H')
+_rec_ens = struct.Struct('<I')
 _index_dtype = {
     None:
     np.dtype([('ens', np.uint64),
@@ -71,26 +79,37 @@ _index_dtype = {
               ('d_ver', np.uint8),
               ])
 }
+# The binary layout of one record of the current index version
+_index_rec = struct.Struct('<QIQ4H6BHB')
 
 
 def _calc_time(year, month, day, hour, minute, second, usec, zero_is_bad=True):
-    dt = np.zeros(year.shape, dtype='float')
-    for idx, (y, mo, d, h, mi, s, u) in enumerate(
-            zip(year, month, day,
-                hour, minute, second, usec)):
-        if (zero_is_bad and mo == 0 and d == 0 and
-                h == 0 and mi == 0 and
-                s == 0 and u == 0):
-            continue
-        try:
-            # Note that month is zero-based, seconds since Jan 1 1970
-            dt[idx] = time.date2epoch(
-                time.datetime(y, mo + 1, d, h, mi, s, u))[0]
-        except ValueError:
-            # One of the time values is out-of-range (e.g., mi > 60)
-            # This probably indicates a corrupted byte, so we just insert None.
-            dt[idx] = None
-    # None -> NaN in this step
+    # Note that month is zero-based. Work in int64 so that none of the
+    # arithmetic below can overflow the (small) input dtypes.
+    year, month, day, hour, minute, second, usec = [
+        np.asarray(v, dtype=np.int64) for v in
+        (year, month, day, hour, minute, second, usec)]
+    # The first day of each month, then the number of days in it
+    mstart = ((year - 1970).astype('datetime64[Y]').astype('datetime64[M]') +
+              month)
+    dstart = mstart.astype('datetime64[D]')
+    ndays = ((mstart + 1).astype('datetime64[D]') - dstart).astype(np.int64)
+    # Whole seconds since Jan 1 1970
+    secs = (((dstart + (day - 1)).astype(np.int64) * 24 + hour) * 60
+            + minute) * 60 + second
+    # Combine in integer microseconds so the result rounds exactly like
+    # datetime.timestamp()
+    dt = (secs * 1000000 + usec) / 1e6
+    # One of the time values is out-of-range (e.g., mi > 60)
+    # This probably indicates a corrupted byte, so we insert NaN.
+    valid = ((year >= 1) & (year <= 9999) & (month >= 0) & (month < 12) &
+             (day >= 1) & (day <= ndays) & (hour >= 0) & (hour < 24) &
+             (minute >= 0) & (minute < 60) & (second >= 0) & (second < 60) &
+             (usec >= 0) & (usec < 1000000))
+    dt[~valid] = np.nan
+    if zero_is_bad:
+        dt[(month == 0) & (day == 0) & (hour == 0) & (minute == 0) &
+           (second == 0) & (usec == 0)] = 0
     return dt
 
 
@@ -98,6 +117,9 @@ def _create_index(infile, outfile, N_ens, debug):
     logging = getLogger()
     print("Indexing {}...".format(infile), end='')
     fin = open(_abspath(infile), 'rb')
+    # Parse the records straight out of a read-only memory map, rather
+    # than issuing a seek/read pair for every field of every record.
+    buf = mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ)
     fout = open(_abspath(outfile), 'wb')
     fout.write(b'Index Ver:')
     fout.write(struct.pack('<H', _index_version))
@@ -111,21 +133,19 @@ def _create_index(infile, outfile, N_ens, debug):
     last_ens = dict.fromkeys(ids, -1)
     seek_2ens = {21:40, 22:40, 23:42, 24:40, 26:40, 28:40, # 23 starts from "42"
                  27:40, 29:40, 30:40, 31:40, 35:40, 36:40}
+    pos = 0
     while N[21] < N_ens:  # Will fail if velocity ping isn't saved first
-        pos = fin.tell()
         try:
-            dat = _hdr.unpack(fin.read(_hdr.size))
+            dat = _hdr.unpack_from(buf, pos)
         except:
             break
         if dat[2] in ids:
             idk = dat[2]
-            d_ver, d_off, config = struct.unpack('<BBH', fin.read(4))
-            fin.seek(4, 1)
-            yr, mo, dy, h, m, s, u = struct.unpack('6BH', fin.read(8))
-            fin.seek(14, 1)
-            beams_cy = struct.unpack('<H', fin.read(2))[0]
-            fin.seek(seek_2ens[dat[2]], 1)
-            ens[idk] = struct.unpack('<I', fin.read(4))[0]
+            # Byte offsets are relative to the start of the record header
+            (d_ver, d_off, config,
+             yr, mo, dy, h, m, s, u) = _rec_cfg_time.unpack_from(buf, pos + 10)
+            beams_cy = _rec_beams_cy.unpack_from(buf, pos + 40)[0]
+            ens[idk] = _rec_ens.unpack_from(buf, pos + 42 + seek_2ens[idk])[0]
 
             if last_ens[idk] > 0:
                 if (ens[idk] == 1) or (ens[idk] < last_ens[idk]):
@@ -136,10 +156,9 @@ def _create_index(infile, outfile, N_ens, debug):
             if last_ens[idk] > 0 and last_ens[idk] != ens[idk]:
                 N[idk] += 1
 
-            fout.write(struct.pack('<QIQ4H6BHB', N[idk], ens[idk], pos, idk,
-                                   config, beams_cy, 0,
-                                   yr, mo + 1, dy, h, m, s, u, d_ver))
-            fin.seek(dat[4] - (36 + seek_2ens[idk]), 1)
+            fout.write(_index_rec.pack(N[idk], ens[idk], pos, idk,
+                                       config, beams_cy, 0,
+                                       yr, mo + 1, dy, h, m, s, u, d_ver))
             last_ens[idk] = ens[idk]
 
             if debug:
@@ -148,8 +167,8 @@ def _create_index(infile, outfile, N_ens, debug):
                 logging.info('%10d: %02X, %d, %02X, %d, %d, %d, %d\n' %
                              (pos, dat[0], dat[1], dat[2], dat[4],
                               N[idk], ens[idk], last_ens[idk]))
-        else:
-            fin.seek(dat[4], 1)
+        pos += _hdr.size + dat[4]
+    buf.close()
     fin.close()
     fout.close()
     print(" Done.")
@@ -217,8 +236,12 @@ def _boolarray_firstensemble_ping(index):
     """Return a boolean of the index that indicates only the first ping in 
     each ensemble.
     """
-    dens = np.ones(index['ens'].shape, dtype='bool')
-    dens[1:] = np.diff(index['ens']) != 0
+    ens = index['ens']
+    dens = np.empty(ens.shape, dtype='bool')
+    dens[:1] = True
+    # Compare neighbours directly into the mask, rather than through a
+    # full-size np.diff array.
+    np.not_equal(ens[1:], ens[:-1], out=dens[1:])
     return dens
 
 
@@ -447,8 +470,11 @@ def _beams_cy_int2dict(val, id):
 
 def _isuniform(vec, exclude=[]):
     if len(exclude):
-        return len(set(np.unique(vec)) - set(exclude)) <= 1
-    return np.all(vec == vec[0])
+        vec = vec[~np.isin(vec, exclude)]
+        if not vec.size:
+            return True
+    # A single min/max reduction, without allocating a boolean array
+    return vec.min() == vec.max()
 
 
 def _collapse(vec, name=None, exclude=[]):
@@ -489,10 +515,12 @@ def _calc_config(index):
         A dict containing the key information for initializing arrays.
     """
 
-    ids = np.unique(index['ID'])
     config = {}
-    for id in ids:
-        if id not in [21, 22, 23, 24, 26, 28, 31]:
+    # Only these IDs are configured, so check for each of them directly
+    # rather than sorting the whole ID column with np.unique.
+    for id in [21, 22, 23, 24, 26, 28, 31]:
+        inds = index['ID'] == id
+        if not inds.any():
             continue
         if id == 23:
             type = 'bt'
@@ -500,7 +528,6 @@ def _calc_config(index):
             type = 'avg'
         else:
             type = 'burst'
-        inds = index['ID'] == id
         _config = index['config'][inds]
         _beams_cy = index['beams_cy'][inds]
 
@@ -63,7 +63,7 @@ def _inst2earth(adcpo, reverse=False, rotate_vars=None, force=False):
     for nm in rotate_vars:
         dat = adcpo[nm].values
         dat[:3] = np.einsum(sumstr, rotmat, dat[:3])
-        adcpo[nm].values = dat.copy()
+        adcpo[nm].values = dat
 
     adcpo = _set_coords(adcpo, cs_new)
 
@@ -147,13 +147,16 @@ def _calc_orientmat(adcpo):
     sr = np.sin(r)
     cp = np.cos(p)
     sp = np.sin(p)
+    # These products are each used twice below
+    shsp = sh * sp
+    chsp = ch * sp
     rotmat = np.empty((3, 3, len(r)))
-    rotmat[0, 0, :] = ch * cr + sh * sp * sr
+    rotmat[0, 0, :] = ch * cr + shsp * sr
     rotmat[0, 1, :] = sh * cp
-    rotmat[0, 2, :] = ch * sr - sh * sp * cr
-    rotmat[1, 0, :] = -sh * cr + ch * sp * sr
+    rotmat[0, 2, :] = ch * sr - shsp * cr
+    rotmat[1, 0, :] = -sh * cr + chsp * sr
     rotmat[1, 1, :] = ch * cp
-    rotmat[1, 2, :] = -sh * sr - ch * sp * cr
+    rotmat[1, 2, :] = -sh * sr - chsp * cr
     rotmat[2, 0, :] = -cp * sr
     rotmat[2, 1, :] = sp
     rotmat[2, 2, :] = cp * cr
@@ -121,7 +121,7 @@ def _inst2earth(adcpo, reverse=False, rotate_vars=None, force=False):
             else:
                 raise Exception("The entry {} is not a vector, it cannot"
                                 "be rotated.".format(nm))
-        adcpo[nm].values = dat.copy()
+        adcpo[nm].values = dat
 
     adcpo = rotb._set_coords(adcpo, cs_new)
 
@@ -91,7 +91,7 @@ def _inst2earth(advo, reverse=False, rotate_vars=None, force=False):
                 "Data must be in the '%s' frame when using this function" %
                 cs_now)
 
-    if hasattr(advo, 'orientmat'):
+    if 'orientmat' in advo:
         omat = advo['orientmat']
     else:
         if 'vector' in advo.inst_model.lower():
@@ -178,7 +178,7 @@ def _earth2principal(advo, reverse=False, rotate_vars=None):
     for nm in rotate_vars:
         dat = advo[nm].values
         dat[:2] = np.einsum('ij,j...->i...', rotmat[:2, :2], dat[:2])
-        advo[nm].values = dat.copy()
+        advo[nm].values = dat
 
     # Finalize the output.
     advo = rotb._set_coords(advo, cs_new)
@@ -3,6 +3,7 @@ from dolfyn.tests import test_read_adp as trp
 from numpy.testing import assert_equal, assert_allclose
 import numpy as np
 import dolfyn.time as time
+from dolfyn.io import nortek2_lib as lib
 from datetime import datetime
 
 
@@ -46,3 +47,24 @@ def test_datenum():
 
     assert_allclose(time.dt642epoch(td.time.values), epoch, atol=1e-6)
     assert_equal(dn[0], 735032.5000311028)
+
+
+def test_calc_time():
+    # Columns: year, month (zero-based), day, hour, minute, second, usec
+    stamps = np.array([
+        [2020, 3, 31, 0, 0, 0, 0],  # April 31st
+        [2020, 1, 29, 12, 30, 15, 500000],  # Feb 29, leap year
+        [2019, 1, 29, 12, 30, 15, 500000],  # Feb 29, non-leap year
+        [2017, 6, 24, 17, 60, 0, 0],  # minute 60
+        [2017, 0, 0, 0, 0, 0, 0],  # all-zero stamp
+        [10000, 0, 1, 0, 0, 0, 0],  # year > 9999
+        [2020, 3, 30, 23, 59, 59, 999900],
+        [2017, 6, 24, 17, 0, 0, 63500],
+    ])
+    valid = [np.nan, 1582979415.5, np.nan, np.nan,
+             np.nan, np.nan, 1588291199.9999, 1500915600.0635]
+
+    # The all-zero stamp is only flagged as NaN if zero_is_bad is False
+    assert_equal(lib._calc_time(*stamps.T, zero_is_bad=False), valid)
+    valid[4] = 0
+    assert_equal(lib._calc_time(*stamps.T), valid)